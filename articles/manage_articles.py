@@ -13,60 +13,24 @@ Usage:
     python manage_articles.py list
     python manage_articles.py validate
     python manage_articles.py sync
+    python manage_articles.py build
+    python manage_articles.py check-external
 """
 
-import json
-import os
-import argparse
+import sys
 from datetime import datetime
 from pathlib import Path
-import re
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "tools"))
+
+from build_core import load_json, render_template, save_json, slugify  # noqa: E402
+from site_cli import collection_main, write_template  # noqa: E402
 
 ARTICLES_DIR = Path(__file__).parent
 ARTICLES_JSON = ARTICLES_DIR / "articles.json"
 TEMPLATE_PATH = ARTICLES_DIR / "article-template.html"
-JS_LOADER_PATH = ARTICLES_DIR.parent / "assets" / "js" / "articles-loader.js"
-
-def slugify(text):
-    """Convert title to URL-friendly slug"""
-    text = re.sub(r'[^\w\s-]', '', text.lower())
-    return re.sub(r'[-\s]+', '-', text)
-
-def sync_articles_to_js():
-    """Sync articles.json data to the JavaScript file for GitHub Pages compatibility"""
-    try:
-        # Load articles data
-        with open(ARTICLES_JSON, 'r', encoding='utf-8') as f:
-            articles_data = json.load(f)
-
-        # Read the JavaScript file
-        with open(JS_LOADER_PATH, 'r', encoding='utf-8') as f:
-            js_content = f.read()
-
-        # Format the articles data as JavaScript
-        articles_js = json.dumps(articles_data, indent=6, ensure_ascii=False)
-
-        # Find and replace the articlesData array in the JavaScript file
-        import re
-        pattern = r'(this\.articlesData = \[)[^;]*(\];)'
-        replacement = f'\\1\n{articles_js.replace("]", "    ]")}\\2'
-
-        updated_js = re.sub(pattern, replacement, js_content, flags=re.DOTALL)
 
-        # Write back the updated JavaScript
-        with open(JS_LOADER_PATH, 'w', encoding='utf-8') as f:
-            f.write(updated_js)
-
-        print(f"✅ Synced {len(articles_data)} articles to JavaScript loader")
-        return True
-
-    except Exception as e:
-        print(f"❌ Error syncing articles to JavaScript: {e}")
-        return False
-
-def create_article_template():
-    """Create a reusable article template"""
-    template = '''<!DOCTYPE html>
+ARTICLE_TEMPLATE = '''<!DOCTYPE html>
 <html lang="en">
 <head>
   <meta charset="utf-8" />
@@ -178,21 +142,17 @@ def create_article_template():
 </body>
 </html>'''
 
-    TEMPLATE_PATH.write_text(template)
-    print(f"Created article template at {TEMPLATE_PATH}")
+def create_article_template():
+    """Create the article template file"""
+    write_template("articles", ARTICLE_TEMPLATE)
 
 def load_articles():
     """Load articles from JSON file"""
-    if not ARTICLES_JSON.exists():
-        return []
-
-    with open(ARTICLES_JSON, 'r') as f:
-        return json.load(f)
+    return load_json(ARTICLES_JSON)
 
 def save_articles(articles):
     """Save articles to JSON file"""
-    with open(ARTICLES_JSON, 'w') as f:
-        json.dump(articles, f, indent=2)
+    save_json(ARTICLES_JSON, articles)
 
 def create_article(title, subtitle="Article • Topic • 2025", description="", cover="placeholder.svg", status="draft"):
     """Create a new article"""
@@ -224,10 +184,11 @@ def create_article(title, subtitle="Article • Topic • 2025", description="",
     if not TEMPLATE_PATH.exists():
         create_article_template()
 
-    template_content = TEMPLATE_PATH.read_text()
-    article_content = template_content.replace("{{TITLE}}", title)
-    article_content = article_content.replace("{{SUBTITLE}}", subtitle)
-    article_content = article_content.replace("{{DESCRIPTION}}", article_data["description"])
+    article_content = render_template(TEMPLATE_PATH.read_text(), {
+        "TITLE": title,
+        "SUBTITLE": subtitle,
+        "DESCRIPTION": article_data["description"],
+    })
 
     article_path.write_text(article_content)
 
@@ -242,89 +203,20 @@ def create_article(title, subtitle="Article • Topic • 2025", description="",
 
     return True
 
-def list_articles():
-    """List all articles"""
-    articles = load_articles()
-
-    if not articles:
-        print("No articles found.")
-        return
-
-    print(f"Found {len(articles)} articles:")
-    print("=" * 50)
-
-    for article in articles:
-        status_indicator = "✅" if article["status"] == "published" else "📝"
-        print(f"{status_indicator} {article['title']}")
-        print(f"   ID: {article['id']}")
-        print(f"   Subtitle: {article['subtitle']}")
-        print(f"   Status: {article['status']}")
-        print(f"   Published: {article['published']}")
-        print()
-
-def validate_articles():
-    """Validate articles and check for issues"""
-    articles = load_articles()
-    issues = []
-
-    for article in articles:
-        article_path = ARTICLES_DIR / article["url"]
-
-        # Check if HTML file exists
-        if not article_path.exists():
-            issues.append(f"Missing file: {article['url']} for article '{article['title']}'")
-
-        # Check for required fields
-        required_fields = ['id', 'title', 'subtitle', 'description', 'published', 'status', 'url']
-        for field in required_fields:
-            if not article.get(field):
-                issues.append(f"Missing {field} for article '{article['title']}'")
+def add_create_arguments(parser):
+    """Declare the options of the create command"""
+    parser.add_argument('title', help='Article title')
+    parser.add_argument('--subtitle', default='Article • Topic • 2025', help='Article subtitle')
+    parser.add_argument('--description', default='', help='Article description')
+    parser.add_argument('--cover', default='placeholder.svg', help='Cover image filename')
+    parser.add_argument('--status', choices=['draft', 'published'], default='draft', help='Article status')
 
-    if issues:
-        print("Validation issues found:")
-        for issue in issues:
-            print(f"❌ {issue}")
-    else:
-        print("✅ All articles validated successfully!")
+def run_create(args):
+    """Run the create command"""
+    return create_article(args.title, args.subtitle, args.description, args.cover, args.status)
 
 def main():
-    parser = argparse.ArgumentParser(description="Manage articles for Mehdi Ben Hamida's website")
-    subparsers = parser.add_subparsers(dest='command', help='Available commands')
-
-    # Create command
-    create_parser = subparsers.add_parser('create', help='Create a new article')
-    create_parser.add_argument('title', help='Article title')
-    create_parser.add_argument('--subtitle', default='Article • Topic • 2025', help='Article subtitle')
-    create_parser.add_argument('--description', default='', help='Article description')
-    create_parser.add_argument('--cover', default='placeholder.svg', help='Cover image filename')
-    create_parser.add_argument('--status', choices=['draft', 'published'], default='draft', help='Article status')
-
-    # List command
-    subparsers.add_parser('list', help='List all articles')
-
-    # Validate command
-    subparsers.add_parser('validate', help='Validate articles')
-
-    # Template command
-    subparsers.add_parser('template', help='Create article template')
-
-    # Sync command
-    subparsers.add_parser('sync', help='Sync articles data to JavaScript for GitHub Pages')
-
-    args = parser.parse_args()
-
-    if args.command == 'create':
-        create_article(args.title, args.subtitle, args.description, args.cover, args.status)
-    elif args.command == 'list':
-        list_articles()
-    elif args.command == 'validate':
-        validate_articles()
-    elif args.command == 'template':
-        create_article_template()
-    elif args.command == 'sync':
-        sync_articles_to_js()
-    else:
-        parser.print_help()
+    return collection_main("articles", "Manage articles for Mehdi Ben Hamida's website", ARTICLE_TEMPLATE, add_create_arguments, run_create)
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
@@ -0,0 +1,11 @@
+// Generated from articles/articles.json by tools/data_modules.py — do not edit by hand.
+// One entry per line, sorted by id, so diffs only touch entries that changed.
+const articles = [
+  {"cover": "docker-best-practices.svg", "description": "Essential Docker patterns for development and production environments.", "id": "docker-best-practices", "published": "2025-12-19", "status": "published", "subtitle": "DevOps • Containers • 2025", "title": "Docker Best Practices", "url": "docker-best-practices.html"},
+  {"cover": "fastapi-patterns.svg", "description": "Patterns for routers, dependencies, error handling, and testing.", "id": "fastapi-patterns", "published": "2025-01-05", "status": "published", "subtitle": "FastAPI • APIs • 2025", "title": "FastAPI Patterns that Scale", "url": "fastapi-patterns.html"},
+  {"cover": "observability.svg", "description": "Setting up logging, metrics, and traces without overwhelming complexity.", "id": "observability-backend", "published": "2025-01-10", "status": "draft", "subtitle": "Monitoring • Logging • 2025", "title": "Observability for Backend Services", "url": "observability-backend.html"},
+  {"cover": "python-structure.svg", "description": "Guidelines for structuring medium-sized Python services for clarity and maintainability.", "id": "python-project-structure", "published": "2025-01-15", "status": "published", "subtitle": "Architecture • Python • 2025", "title": "Practical Python Project Structure", "url": "python-project-structure.html"},
+  {"cover": "syntax-highlighting.svg", "description": "Demonstration of automatic syntax highlighting for multiple programming languages.", "id": "syntax-highlighting-demo", "published": "2025-01-16", "status": "published", "subtitle": "Demo • Features • 2025", "title": "Syntax Highlighting Demo", "url": "syntax-highlighting-demo.html"},
+];
+
+export default articles;
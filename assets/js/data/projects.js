@@ -0,0 +1,11 @@
+// Generated from portfolio/projects.json by tools/data_modules.py — do not edit by hand.
+// One entry per line, sorted by id, so diffs only touch entries that changed.
+const projects = [
+  {"created": "2024-05-10", "demo": "", "description": "Developer-friendly CLI tools for automation and daily workflows.", "featured": false, "github": "https://github.com/mehdibenhamida/cli-toolkit", "id": "cli-toolkit", "status": "published", "subtitle": "Python • Typer • Rich", "technologies": ["Python", "Typer", "Rich", "Click"], "title": "CLI Toolkit"},
+  {"created": "2024-08-15", "demo": "", "description": "Composable DAGs, clear observability, and robust retries for production pipelines.", "featured": true, "github": "https://github.com/mehdibenhamida/data-pipeline-orchestrator", "id": "data-pipeline-orchestrator", "status": "published", "subtitle": "Python • Airflow • Docker", "technologies": ["Python", "Apache Airflow", "Docker", "PostgreSQL"], "title": "Data Pipeline Orchestrator"},
+  {"created": "2024-06-20", "demo": "", "description": "Opinionated template with health checks, logging, error handling, and CI.", "featured": true, "github": "https://github.com/mehdibenhamida/fastapi-service-template", "id": "fastapi-service-template", "status": "published", "subtitle": "FastAPI • Pydantic • Testing", "technologies": ["FastAPI", "Pydantic", "pytest", "Docker"], "title": "FastAPI Service Template"},
+  {"created": "2024-03-15", "demo": "", "description": "Scalable authentication service with JWT tokens, refresh mechanisms, and Redis caching.", "featured": true, "github": "https://github.com/mehdibenhamida/microservices-auth", "id": "microservices-auth", "status": "published", "subtitle": "JWT • Redis • FastAPI", "technologies": ["FastAPI", "JWT", "Redis", "PostgreSQL"], "title": "Microservices Authentication"},
+  {"created": "2024-02-01", "demo": "", "description": "End-to-end machine learning pipeline with automated training, validation, and deployment.", "featured": false, "github": "https://github.com/mehdibenhamida/ml-pipeline-automation", "id": "ml-pipeline-automation", "status": "published", "subtitle": "MLOps • Python • Kubernetes", "technologies": ["Python", "scikit-learn", "Kubernetes", "MLflow"], "title": "ML Pipeline Automation"},
+];
+
+export default projects;
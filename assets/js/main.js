@@ -217,4 +217,13 @@
     });
   });
 
+  // Offline support and faster repeat visits (sw.js is generated by the build)
+  if ('serviceWorker' in navigator && window.location.protocol !== 'file:') {
+    window.addEventListener('load', () => {
+      navigator.serviceWorker.register('/sw.js').catch(error => {
+        console.warn('Service worker registration failed:', error);
+      });
+    });
+  }
+
 })();
@@ -1,98 +1,13 @@
 // Portfolio loader - compatible with GitHub Pages static hosting
 // Based on ArticlesLoader pattern for consistency
+import projectsData from './data/projects.js';
+
 class PortfolioLoader {
   constructor() {
     this.projects = [];
     this.portfolioContainer = null;
-    // Embedded projects data for GitHub Pages compatibility
-    this.projectsData = [
-[
-      {
-            "id": "data-pipeline-orchestrator",
-            "title": "Data Pipeline Orchestrator",
-            "subtitle": "Python • Airflow • Docker",
-            "description": "Composable DAGs, clear observability, and robust retries for production pipelines.",
-            "github": "https://github.com/mehdibenhamida/data-pipeline-orchestrator",
-            "demo": "",
-            "technologies": [
-                  "Python",
-                  "Apache Airflow",
-                  "Docker",
-                  "PostgreSQL"
-                ],
-            "status": "published",
-            "created": "2024-08-15",
-            "featured": true
-      },
-      {
-            "id": "fastapi-service-template",
-            "title": "FastAPI Service Template",
-            "subtitle": "FastAPI • Pydantic • Testing",
-            "description": "Opinionated template with health checks, logging, error handling, and CI.",
-            "github": "https://github.com/mehdibenhamida/fastapi-service-template",
-            "demo": "",
-            "technologies": [
-                  "FastAPI",
-                  "Pydantic",
-                  "pytest",
-                  "Docker"
-                ],
-            "status": "published",
-            "created": "2024-06-20",
-            "featured": true
-      },
-      {
-            "id": "cli-toolkit",
-            "title": "CLI Toolkit",
-            "subtitle": "Python • Typer • Rich",
-            "description": "Developer-friendly CLI tools for automation and daily workflows.",
-            "github": "https://github.com/mehdibenhamida/cli-toolkit",
-            "demo": "",
-            "technologies": [
-                  "Python",
-                  "Typer",
-                  "Rich",
-                  "Click"
-                ],
-            "status": "published",
-            "created": "2024-05-10",
-            "featured": false
-      },
-      {
-            "id": "microservices-auth",
-            "title": "Microservices Authentication",
-            "subtitle": "JWT • Redis • FastAPI",
-            "description": "Scalable authentication service with JWT tokens, refresh mechanisms, and Redis caching.",
-            "github": "https://github.com/mehdibenhamida/microservices-auth",
-            "demo": "",
-            "technologies": [
-                  "FastAPI",
-                  "JWT",
-                  "Redis",
-                  "PostgreSQL"
-                ],
-            "status": "published",
-            "created": "2024-03-15",
-            "featured": true
-      },
-      {
-            "id": "ml-pipeline-automation",
-            "title": "ML Pipeline Automation",
-            "subtitle": "MLOps • Python • Kubernetes",
-            "description": "End-to-end machine learning pipeline with automated training, validation, and deployment.",
-            "github": "https://github.com/mehdibenhamida/ml-pipeline-automation",
-            "demo": "",
-            "technologies": [
-                  "Python",
-                  "scikit-learn",
-                  "Kubernetes",
-                  "MLflow"
-                ],
-            "status": "published",
-            "created": "2024-02-01",
-            "featured": false
-      }
-    ]];
+    // Projects data generated from projects.json (see portfolio/manage_projects.py sync)
+    this.projectsData = [...projectsData];
   }
 
   async init() {
@@ -106,13 +21,7 @@ class PortfolioLoader {
   loadProjects() {
     try {
       // Filter to only show published projects
-      this.projects = this.projectsData.filter(project => project.status === 'published');
-      // Sort by creation date (newest first), with featured projects prioritized
-      this.projects.sort((a, b) => {
-        if (a.featured && !b.featured) return -1;
-        if (!a.featured && b.featured) return 1;
-        return new Date(b.created) - new Date(a.created);
-      });
+      this.projects = this.sortProjects(this.projectsData.filter(project => project.status === 'published'));
       console.log('Loaded projects:', this.projects);
     } catch (error) {
       console.error('Error loading projects:', error);
@@ -120,6 +29,15 @@ class PortfolioLoader {
     }
   }
 
+  // Sort by creation date (newest first), with featured projects prioritized
+  sortProjects(projects) {
+    return projects.sort((a, b) => {
+      if (a.featured && !b.featured) return -1;
+      if (!a.featured && b.featured) return 1;
+      return new Date(b.created) - new Date(a.created);
+    });
+  }
+
   formatDate(dateString) {
     const date = new Date(dateString);
     return date.toLocaleDateString('en-US', {
@@ -182,7 +100,7 @@ class PortfolioLoader {
 
   // Method to add a new project (for future admin functionality)
   addProject(projectData) {
-    // Add to the embedded data
+    // Add to the loaded data
     this.projectsData.unshift(projectData);
     // Reload and re-render
     this.loadProjects();
@@ -213,10 +131,10 @@ class PortfolioLoader {
     if (!tech) {
       this.loadProjects();
     } else {
-      this.projects = this.projectsData.filter(project =>
+      this.projects = this.sortProjects(this.projectsData.filter(project =>
         project.status === 'published' &&
         project.technologies?.some(t => t.toLowerCase().includes(tech.toLowerCase()))
-      );
+      ));
     }
     this.renderProjects();
     this.updateFilterButtons(buttonElement);
@@ -224,9 +142,9 @@ class PortfolioLoader {
 
   // Show only featured projects
   showFeaturedOnly(buttonElement = null) {
-    this.projects = this.projectsData.filter(project =>
+    this.projects = this.sortProjects(this.projectsData.filter(project =>
       project.status === 'published' && project.featured
-    );
+    ));
     this.renderProjects();
     this.updateFilterButtons(buttonElement);
   }
@@ -13,60 +13,24 @@ Usage:
     python manage_projects.py list
     python manage_projects.py validate
     python manage_projects.py sync
+    python manage_projects.py build
+    python manage_projects.py check-external
 """
 
-import json
-import os
-import argparse
+import sys
 from datetime import datetime
 from pathlib import Path
-import re
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "tools"))
+
+from build_core import load_json, render_template, save_json, slugify  # noqa: E402
+from site_cli import collection_main, write_template  # noqa: E402
 
 PORTFOLIO_DIR = Path(__file__).parent
 PROJECTS_JSON = PORTFOLIO_DIR / "projects.json"
 TEMPLATE_PATH = PORTFOLIO_DIR / "project-template.html"
-JS_LOADER_PATH = PORTFOLIO_DIR.parent / "assets" / "js" / "portfolio-loader.js"
-
-def slugify(text):
-    """Convert title to URL-friendly slug"""
-    text = re.sub(r'[^\w\s-]', '', text.lower())
-    return re.sub(r'[-\s]+', '-', text)
-
-def sync_projects_to_js():
-    """Sync projects.json data to the JavaScript file for GitHub Pages compatibility"""
-    try:
-        # Load projects data
-        with open(PROJECTS_JSON, 'r', encoding='utf-8') as f:
-            projects_data = json.load(f)
-
-        # Read the JavaScript file
-        with open(JS_LOADER_PATH, 'r', encoding='utf-8') as f:
-            js_content = f.read()
-
-        # Format the projects data as JavaScript
-        projects_js = json.dumps(projects_data, indent=6, ensure_ascii=False)
-
-        # Find and replace the projectsData array in the JavaScript file
-        import re
-        pattern = r'(this\.projectsData = \[)[^;]*(\];)'
-        replacement = f'\\1\n{projects_js.replace("]", "    ]")}\\2'
 
-        updated_js = re.sub(pattern, replacement, js_content, flags=re.DOTALL)
-
-        # Write back the updated JavaScript
-        with open(JS_LOADER_PATH, 'w', encoding='utf-8') as f:
-            f.write(updated_js)
-
-        print(f"✅ Synced {len(projects_data)} projects to JavaScript loader")
-        return True
-
-    except Exception as e:
-        print(f"❌ Error syncing projects to JavaScript: {e}")
-        return False
-
-def create_project_template():
-    """Create the project template file"""
-    template = '''<!DOCTYPE html>
+PROJECT_TEMPLATE = '''<!DOCTYPE html>
 <html lang="en">
 <head>
   <meta charset="utf-8" />
@@ -239,21 +203,17 @@ python main.py</code></pre>
 </body>
 </html>'''
 
-    TEMPLATE_PATH.write_text(template)
-    print(f"Created project template at {TEMPLATE_PATH}")
+def create_project_template():
+    """Create the project template file"""
+    write_template("projects", PROJECT_TEMPLATE)
 
 def load_projects():
     """Load projects from JSON file"""
-    if not PROJECTS_JSON.exists():
-        return []
-
-    with open(PROJECTS_JSON, 'r') as f:
-        return json.load(f)
+    return load_json(PROJECTS_JSON)
 
 def save_projects(projects):
     """Save projects to JSON file"""
-    with open(PROJECTS_JSON, 'w') as f:
-        json.dump(projects, f, indent=2)
+    save_json(PROJECTS_JSON, projects)
 
 def create_project(title, subtitle="Tech • Stack • Year", description="", github="", demo="", technologies=None, featured=False, status="draft"):
     """Create a new project"""
@@ -297,13 +257,13 @@ def create_project(title, subtitle="Tech • Stack • Year", description="", gi
     # Create HTML file from template
     project_path = PORTFOLIO_DIR / filename
     if TEMPLATE_PATH.exists():
-        template_content = TEMPLATE_PATH.read_text()
-
         # Replace placeholders
-        content = template_content.replace('{{TITLE}}', title)
-        content = content.replace('{{SUBTITLE}}', subtitle)
-        content = content.replace('{{DESCRIPTION}}', description)
-        content = content.replace('{{GITHUB}}', github)
+        content = render_template(TEMPLATE_PATH.read_text(), {
+            'TITLE': title,
+            'SUBTITLE': subtitle,
+            'DESCRIPTION': description,
+            'GITHUB': github,
+        })
 
         # Handle demo link
         if demo:
@@ -325,106 +285,32 @@ def create_project(title, subtitle="Tech • Stack • Year", description="", gi
 
     return True
 
-def list_projects():
-    """List all projects"""
-    projects = load_projects()
-
-    if not projects:
-        print("No projects found.")
-        return
-
-    print(f"Found {len(projects)} projects:")
-    print("=" * 50)
-
-    for project in projects:
-        status_indicator = "✅" if project["status"] == "published" else "📝"
-        featured_indicator = "🌟 " if project.get("featured", False) else ""
-        print(f"{status_indicator} {featured_indicator}{project['title']}")
-        print(f"   ID: {project['id']}")
-        print(f"   Subtitle: {project['subtitle']}")
-        print(f"   Status: {project['status']}")
-        print(f"   Created: {project['created']}")
-        if project.get('github'):
-            print(f"   GitHub: {project['github']}")
-        if project.get('technologies'):
-            print(f"   Tech: {', '.join(project['technologies'])}")
-        print()
-
-def validate_projects():
-    """Validate projects and check for issues"""
-    projects = load_projects()
-    issues = []
-
-    for project in projects:
-        project_path = PORTFOLIO_DIR / f"{project['id']}.html"
-
-        # Check if HTML file exists
-        if not project_path.exists():
-            issues.append(f"Missing file: {project['id']}.html for project '{project['title']}'")
-
-        # Check for required fields
-        required_fields = ['id', 'title', 'subtitle', 'description', 'created', 'status']
-        for field in required_fields:
-            if not project.get(field):
-                issues.append(f"Missing {field} for project '{project['title']}'")
-
-    if issues:
-        print("Validation issues found:")
-        for issue in issues:
-            print(f"❌ {issue}")
-    else:
-        print("✅ All projects validated successfully!")
+def add_create_arguments(parser):
+    """Declare the options of the create command"""
+    parser.add_argument('title', help='Project title')
+    parser.add_argument('--subtitle', default='Tech • Stack • Year', help='Project subtitle')
+    parser.add_argument('--description', default='', help='Project description')
+    parser.add_argument('--github', default='', help='GitHub repository URL')
+    parser.add_argument('--demo', default='', help='Demo URL')
+    parser.add_argument('--technologies', nargs='*', help='Technologies used')
+    parser.add_argument('--featured', action='store_true', help='Mark as featured project')
+    parser.add_argument('--status', choices=['draft', 'published'], default='draft', help='Project status')
+
+def run_create(args):
+    """Run the create command"""
+    return create_project(
+        args.title,
+        args.subtitle,
+        args.description,
+        args.github,
+        args.demo,
+        args.technologies,
+        args.featured,
+        args.status
+    )
 
 def main():
-    parser = argparse.ArgumentParser(description="Manage portfolio projects for Mehdi Ben Hamida's website")
-    subparsers = parser.add_subparsers(dest='command', help='Available commands')
-
-    # Create command
-    create_parser = subparsers.add_parser('create', help='Create a new project')
-    create_parser.add_argument('title', help='Project title')
-    create_parser.add_argument('--subtitle', default='Tech • Stack • Year', help='Project subtitle')
-    create_parser.add_argument('--description', default='', help='Project description')
-    create_parser.add_argument('--github', default='', help='GitHub repository URL')
-    create_parser.add_argument('--demo', default='', help='Demo URL')
-    create_parser.add_argument('--technologies', nargs='*', help='Technologies used')
-    create_parser.add_argument('--featured', action='store_true', help='Mark as featured project')
-    create_parser.add_argument('--status', choices=['draft', 'published'], default='draft', help='Project status')
-
-    # List command
-    subparsers.add_parser('list', help='List all projects')
-
-    # Validate command
-    subparsers.add_parser('validate', help='Validate projects')
-
-    # Template command
-    subparsers.add_parser('template', help='Create project template')
-
-    # Sync command
-    subparsers.add_parser('sync', help='Sync projects data to JavaScript for GitHub Pages')
-
-    args = parser.parse_args()
-
-    if args.command == 'create':
-        create_project(
-            args.title,
-            args.subtitle,
-            args.description,
-            args.github,
-            args.demo,
-            args.technologies,
-            args.featured,
-            args.status
-        )
-    elif args.command == 'list':
-        list_projects()
-    elif args.command == 'validate':
-        validate_projects()
-    elif args.command == 'template':
-        create_project_template()
-    elif args.command == 'sync':
-        sync_projects_to_js()
-    else:
-        parser.print_help()
+    return collection_main("projects", "Manage portfolio projects for Mehdi Ben Hamida's website", PROJECT_TEMPLATE, add_create_arguments, run_create)
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
@@ -0,0 +1,87 @@
+// Generated by tools/service_worker.py — do not edit by hand.
+// Run `python3 articles/manage_articles.py build` to regenerate.
+const PRECACHE = 'mbh-precache';
+const RUNTIME = 'mbh-pages';
+const PRECACHE_MANIFEST = [
+  {"revision": "a1f9d27ab475cd7d", "url": "assets/css/styles.css"},
+  {"revision": "86f24d3c0683d2ea", "url": "assets/css/prism-theme.css"},
+  {"revision": "d55f7d24333562d0", "url": "assets/js/main.js"},
+  {"revision": "df18c9d10109ca3d", "url": "assets/js/articles-loader.js"},
+  {"revision": "7c2ae9ac226999d2", "url": "assets/js/portfolio-loader.js"},
+  {"revision": "05e4ce106c6af382", "url": "assets/js/data/articles.js"},
+  {"revision": "f0723cb85363a2ae", "url": "assets/js/data/projects.js"},
+  {"revision": "cc905f531ee71283", "url": "assets/js/syntax-highlighter.js"},
+  {"revision": "9f081d20c7c14cd4", "url": "assets/img/favicon.ico"}
+];
+const RUNTIME_ROUTES = [/^articles\.html$/, /^articles\/[^\/]+\.html$/, /^portfolio\.html$/, /^portfolio\/[^\/]+\.html$/];
+
+const scopeUrl = new URL(self.registration.scope);
+const revisionedUrl = entry => new URL(`${entry.url}?__rev=${entry.revision}`, scopeUrl).href;
+const precacheKeys = new Map(
+  PRECACHE_MANIFEST.map(entry => [new URL(entry.url, scopeUrl).href, revisionedUrl(entry)])
+);
+
+self.addEventListener('install', event => {
+  event.waitUntil((async () => {
+    const cache = await caches.open(PRECACHE);
+    // Only assets whose revision changed since the last deploy are fetched.
+    await Promise.all(PRECACHE_MANIFEST.map(async entry => {
+      const key = revisionedUrl(entry);
+      if (!(await cache.match(key))) {
+        const response = await fetch(key, { cache: 'no-cache' });
+        if (!response.ok) throw new Error(`Precache failed for ${entry.url}: ${response.status}`);
+        await cache.put(key, response);
+      }
+    }));
+    await self.skipWaiting();
+  })());
+});
+
+self.addEventListener('activate', event => {
+  event.waitUntil((async () => {
+    const expected = new Set(precacheKeys.values());
+    const cache = await caches.open(PRECACHE);
+    for (const request of await cache.keys()) {
+      if (!expected.has(request.url)) await cache.delete(request);
+    }
+    for (const name of await caches.keys()) {
+      if (name.startsWith('mbh-') && name !== PRECACHE && name !== RUNTIME) await caches.delete(name);
+    }
+    await self.clients.claim();
+  })());
+});
+
+const staleWhileRevalidate = async (event, request) => {
+  const cache = await caches.open(RUNTIME);
+  const cached = await cache.match(request, { ignoreSearch: true });
+  const network = fetch(request).then(response => {
+    if (response.ok) cache.put(request, response.clone());
+    return response;
+  });
+  if (cached) {
+    event.waitUntil(network.catch(() => undefined));
+    return cached;
+  }
+  return network;
+};
+
+self.addEventListener('fetch', event => {
+  const { request } = event;
+  if (request.method !== 'GET') return;
+
+  const url = new URL(request.url);
+  if (url.origin !== scopeUrl.origin) return;
+
+  const precacheKey = precacheKeys.get(url.origin + url.pathname);
+  if (precacheKey) {
+    event.respondWith(caches.open(PRECACHE)
+      .then(cache => cache.match(precacheKey))
+      .then(cached => cached || fetch(request)));
+    return;
+  }
+
+  const path = url.pathname.slice(scopeUrl.pathname.length);
+  if (RUNTIME_ROUTES.some(route => route.test(path))) {
+    event.respondWith(staleWhileRevalidate(event, request));
+  }
+});
@@ -0,0 +1,136 @@
+"""Tests for the incremental build graph in tools/build_core.py"""
+
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "tools"))
+
+from build_core import BuildError, BuildGraph  # noqa: E402
+
+
+class BuildGraphTest(unittest.TestCase):
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self._tmp.name)
+        self.source = self.root / "source.txt"
+        self.source.write_text("v1")
+        self.runs = []
+
+        # source -> data -> (bundle, hints); other is independent of source.
+        self.graph = BuildGraph(self.root)
+        self.graph.add("data", self._copy("data", self.source, "data.txt"),
+                       inputs=[self.source], outputs=[self.root / "data.txt"])
+        self.graph.add("other", self._copy("other", self.source, "other.txt"),
+                       inputs=[self.source], outputs=[self.root / "other.txt"])
+        self.graph.add("bundle", self._copy("bundle", self.root / "data.txt", "bundle.txt"),
+                       outputs=[self.root / "bundle.txt"], deps=["data"])
+        self.graph.add("hints", self._copy("hints", self.root / "bundle.txt", "hints.txt"),
+                       outputs=[self.root / "hints.txt"], deps=["bundle"])
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _copy(self, name, source, target):
+        def action():
+            self.runs.append(name)
+            (self.root / target).write_text(source.read_text())
+        return action
+
+    def test_second_run_is_fresh(self):
+        self.assertEqual(set(self.graph.run().values()), {"built"})
+        self.runs.clear()
+        self.assertEqual(set(self.graph.run().values()), {"fresh"})
+        self.assertEqual(self.runs, [])
+
+    def test_earlier_input_state_is_restored_from_the_object_store(self):
+        self.graph.run()
+        self.source.write_text("v2")
+        self.graph.run()
+        self.source.write_text("v1")
+        self.runs.clear()
+
+        results = self.graph.run()
+        self.assertEqual(set(results.values()), {"restored"})
+        self.assertEqual(self.runs, [])
+        self.assertEqual((self.root / "hints.txt").read_text(), "v1")
+        self.assertTrue(any((self.root / ".build-cache" / "objects").rglob("*")))
+
+    def test_same_size_edit_within_one_timestamp_tick_is_detected(self):
+        self.graph.run()
+        stat = self.source.stat()
+        self.source.write_text("v2")
+        # Simulate a filesystem with coarse timestamps: size and mtime match.
+        os.utime(self.source, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+        results = self.graph.run(["data"])
+        self.assertEqual(results, {"data": "built"})
+        self.assertEqual((self.root / "data.txt").read_text(), "v2")
+
+    def test_failed_action_skips_its_dependents(self):
+        def fail():
+            raise RuntimeError("boom")
+
+        self.graph.add("broken", fail, deps=["data"])
+        self.graph.add("after-broken", self._copy("after-broken", self.source, "after.txt"),
+                       outputs=[self.root / "after.txt"], deps=["broken"])
+
+        results = self.graph.run()
+        self.assertEqual(results["broken"], "failed")
+        self.assertEqual(results["after-broken"], "skipped")
+        self.assertEqual(results["hints"], "built")
+        self.assertNotIn("after-broken", self.runs)
+
+    def test_dependency_cycle_raises(self):
+        self.graph.add("first", lambda: None, deps=["second"])
+        self.graph.add("second", lambda: None, deps=["first"])
+        with self.assertRaises(BuildError):
+            self.graph.run(["first"])
+
+    def test_node_rewriting_its_inputs_stays_fresh(self):
+        page = self.root / "page.html"
+        page.write_text("<head></head>")
+
+        def stamp():
+            self.runs.append("stamp")
+            text = page.read_text()
+            if "<!-- stamped -->" not in text:
+                page.write_text(text.replace("<head>", "<head><!-- stamped -->"))
+
+        node = self.graph.add("stamp", stamp, inputs=[page], outputs=[page])
+        self.assertTrue(node.rewrites_inputs)
+        self.assertEqual(self.graph.run(["stamp"]), {"stamp": "built"})
+        self.assertEqual(self.graph.run(["stamp"]), {"stamp": "fresh"})
+        self.assertEqual(self.runs, ["stamp"])
+
+    def test_dependents_are_transitive(self):
+        self.assertEqual(set(self.graph.dependents(["data"])), {"data", "bundle", "hints"})
+        self.assertEqual(self.graph.dependents(["other"]), ["other"])
+
+    def test_dependents_rejects_unknown_nodes(self):
+        with self.assertRaises(BuildError):
+            self.graph.dependents(["missing"])
+
+    def test_run_without_downstream_only_builds_upstream(self):
+        results = self.graph.run(["data"])
+        self.assertEqual(results, {"data": "built"})
+
+    def test_run_downstream_refreshes_dependents(self):
+        self.graph.run()
+        self.source.write_text("v2")
+        self.runs.clear()
+
+        results = self.graph.run(["data"], downstream=True)
+        self.assertEqual(set(results), {"data", "bundle", "hints"})
+        self.assertEqual(self.runs, ["data", "bundle", "hints"])
+        self.assertEqual((self.root / "hints.txt").read_text(), "v2")
+
+        results = self.graph.run(["data"], downstream=True)
+        self.assertEqual(set(results.values()), {"fresh"})
+
+
+if __name__ == "__main__":
+    unittest.main()
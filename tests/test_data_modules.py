@@ -0,0 +1,86 @@
+"""Tests for the canonical data module emitter in tools/data_modules.py"""
+
+import json
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "tools"))
+
+from data_modules import emit_data_module, write_data_module  # noqa: E402
+
+ENTRIES = [
+    {"id": "b-entry", "title": "Second", "description": "Ends a statement; closes an array ] and a block };"},
+    {"id": "a-entry", "title": "Première", "description": "Non-ASCII: café, naïve, 日本語, emoji 🚀"},
+    {"id": "c-entry", "title": "Third", "tags": ["x", "y"], "featured": True},
+]
+
+
+def parse_module(source):
+    """Read the entries back out of an emitted module"""
+    body = source[source.index("[\n") + 1:source.rindex("];")]
+    return json.loads("[" + body.rstrip().rstrip(",") + "]")
+
+
+class EmitDataModuleTest(unittest.TestCase):
+
+    def test_round_trip_with_delimiters_in_strings(self):
+        source = emit_data_module(ENTRIES, "articles", "articles/articles.json")
+        self.assertEqual(parse_module(source), sorted(ENTRIES, key=lambda e: e["id"]))
+        self.assertIn("日本語", source)
+        self.assertTrue(source.endswith("export default articles;\n"))
+
+    @unittest.skipUnless(shutil.which("node"), "node is not installed")
+    def test_module_imports_in_node(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "articles.mjs"
+            path.write_text(emit_data_module(ENTRIES, "articles", "articles/articles.json"), encoding="utf-8")
+            script = f"import data from {json.dumps(path.as_uri())}; console.log(JSON.stringify(data));"
+            output = subprocess.run(["node", "--input-type=module", "-e", script],
+                                    capture_output=True, check=True, encoding="utf-8").stdout
+        self.assertEqual(json.loads(output), sorted(ENTRIES, key=lambda e: e["id"]))
+
+    def test_output_is_canonical(self):
+        first = emit_data_module(ENTRIES, "articles", "articles/articles.json")
+        again = emit_data_module(ENTRIES, "articles", "articles/articles.json")
+        shuffled = [dict(reversed(list(entry.items()))) for entry in reversed(ENTRIES)]
+        self.assertEqual(first.encode("utf-8"), again.encode("utf-8"))
+        self.assertEqual(first.encode("utf-8"), emit_data_module(shuffled, "articles", "articles/articles.json").encode("utf-8"))
+
+    def test_editing_one_entry_changes_one_line(self):
+        edited = [dict(entry) for entry in ENTRIES]
+        edited[2]["title"] = "Third, revised"
+        before = emit_data_module(ENTRIES, "articles", "articles/articles.json").splitlines()
+        after = emit_data_module(edited, "articles", "articles/articles.json").splitlines()
+        self.assertEqual(len(before), len(after))
+        changed = [old for old, new in zip(before, after) if old != new]
+        self.assertEqual(len(changed), 1)
+        self.assertIn('"c-entry"', changed[0])
+
+    def test_large_collections_emit_in_linear_time(self):
+        entries = [{"id": f"entry-{n:06d}", "title": f"Entry {n}", "tags": ["a", "b"]} for n in range(100_000)]
+        start = time.perf_counter()
+        source = emit_data_module(entries, "articles", "articles/articles.json")
+        elapsed = time.perf_counter() - start
+        self.assertEqual(len(parse_module(source)), 100_000)
+        # About 0.4s on a laptop; the bound only catches quadratic regressions.
+        self.assertLess(elapsed, 5.0)
+
+
+class WriteDataModuleTest(unittest.TestCase):
+
+    def test_unchanged_data_leaves_the_file_untouched(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "data" / "articles.js"
+            self.assertTrue(write_data_module(path, ENTRIES, "articles", "articles/articles.json"))
+            mtime = path.stat().st_mtime_ns
+            self.assertFalse(write_data_module(path, list(reversed(ENTRIES)), "articles", "articles/articles.json"))
+            self.assertEqual(path.stat().st_mtime_ns, mtime)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,158 @@
+"""Tests for tools/link_checker.py against a local stub HTTP server"""
+
+import asyncio
+import sys
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "tools"))
+
+from link_checker import check_urls, extract_external_urls  # noqa: E402
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    """Serve a fixed set of routes that exercise each checker code path"""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_HEAD(self):
+        self._respond(head=True)
+
+    def do_GET(self):
+        self._respond(head=False)
+
+    def _respond(self, head):
+        self.server.requests.append((self.command, self.path))
+        path = self.path.split("?")[0]
+        if path == "/ok":
+            self._send(200)
+        elif path == "/no-head":
+            self._send(405 if head else 200)
+        elif path == "/redirect":
+            self._send(301, location="/ok")
+        elif path == "/loop":
+            self._send(302, location="/loop")
+        elif path == "/slow":
+            time.sleep(1.0)
+            self._send(200)
+        else:
+            self._send(404)
+
+    def _send(self, status, location=None):
+        body = b"stub"
+        self.send_response(status)
+        if location:
+            self.send_header("Location", location)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if self.command != "HEAD":
+            self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class LinkCheckerTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), _StubHandler)
+        cls.server.daemon_threads = True
+        cls.server.requests = []
+        cls.thread = threading.Thread(target=cls.server.serve_forever, daemon=True)
+        cls.thread.start()
+        cls.base = f"http://127.0.0.1:{cls.server.server_address[1]}"
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        self.server.requests.clear()
+
+    def check(self, paths, cache=None, ttl=86400, **options):
+        options.setdefault("interval", 0)
+        options.setdefault("timeout", 5.0)
+        urls = [self.base + path for path in paths]
+        return asyncio.run(check_urls(urls, cache, ttl, **options))
+
+    def test_ok(self):
+        result = self.check(["/ok"])[self.base + "/ok"]
+        self.assertTrue(result["ok"])
+        self.assertEqual(result["status"], 200)
+        self.assertEqual(self.server.requests, [("HEAD", "/ok")])
+
+    def test_head_not_allowed_falls_back_to_get(self):
+        result = self.check(["/no-head"])[self.base + "/no-head"]
+        self.assertTrue(result["ok"])
+        self.assertEqual(result["status"], 200)
+        self.assertEqual(self.server.requests, [("HEAD", "/no-head"), ("GET", "/no-head")])
+
+    def test_redirect_is_followed(self):
+        result = self.check(["/redirect"])[self.base + "/redirect"]
+        self.assertTrue(result["ok"])
+        self.assertEqual(result["final_url"], self.base + "/ok")
+
+    def test_redirect_loop_is_broken(self):
+        result = self.check(["/loop"])[self.base + "/loop"]
+        self.assertFalse(result["ok"])
+
+    def test_not_found_is_broken(self):
+        result = self.check(["/missing"])[self.base + "/missing"]
+        self.assertFalse(result["ok"])
+        self.assertEqual(result["status"], 404)
+
+    def test_timeout_is_broken(self):
+        result = self.check(["/slow"], timeout=0.2)[self.base + "/slow"]
+        self.assertFalse(result["ok"])
+        self.assertIsNone(result["status"])
+        self.assertTrue(result["error"])
+
+    def test_throttling_does_not_count_towards_the_timeout(self):
+        # 20 requests 0.1s apart take 2s in total, well past the 0.5s timeout.
+        paths = [f"/ok?page={n}" for n in range(20)]
+        results = self.check(paths, interval=0.1, timeout=0.5, per_host=4)
+        self.assertEqual([url for url, result in results.items() if not result["ok"]], [])
+
+    def test_connection_refused_is_broken(self):
+        with ThreadingHTTPServer(("127.0.0.1", 0), _StubHandler) as closed:
+            url = f"http://127.0.0.1:{closed.server_address[1]}/ok"
+        result = asyncio.run(check_urls([url], interval=0, timeout=2.0))[url]
+        self.assertFalse(result["ok"])
+        self.assertTrue(result["error"])
+
+    def test_recently_verified_urls_are_skipped(self):
+        cache = {}
+        self.check(["/ok", "/missing"], cache)
+        self.server.requests.clear()
+
+        results = self.check(["/ok", "/missing"], cache)
+        self.assertEqual(self.server.requests, [("HEAD", "/missing"), ("GET", "/missing")])
+        self.assertTrue(results[self.base + "/ok"]["ok"])
+
+        self.server.requests.clear()
+        self.check(["/ok"], cache, ttl=0)
+        self.assertEqual(self.server.requests, [("HEAD", "/ok")])
+
+
+class ExtractExternalUrlsTest(unittest.TestCase):
+
+    def test_covers_pages_and_collection_url_fields(self):
+        sources = extract_external_urls()
+        linkedin = [url for url in sources if "linkedin.com" in url]
+        self.assertEqual(len(linkedin), 1)
+        self.assertIn("contact.html", sources[linkedin[0]])
+        self.assertIn("index.html", sources["https://github.com/mehdibenhamida"])
+        self.assertTrue(any(source.startswith("projects.json:") for urls in sources.values() for source in urls))
+
+    def test_locations_are_deduplicated(self):
+        for url, locations in extract_external_urls().items():
+            self.assertEqual(len(locations), len(set(locations)), url)
+
+
+if __name__ == "__main__":
+    unittest.main()
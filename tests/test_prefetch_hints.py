@@ -0,0 +1,138 @@
+"""Tests for resource hint injection in tools/prefetch_hints.py"""
+
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "tools"))
+
+import prefetch_hints  # noqa: E402
+from prefetch_hints import (  # noqa: E402
+    HINTS_END,
+    HINTS_START,
+    _PageParser,
+    apply_prefetch_hints,
+    page_hints,
+    rank_next_pages,
+)
+
+PAGE = """<!DOCTYPE html>
+<html>
+<head>
+  <meta charset="UTF-8">
+  <link rel="stylesheet" href="https://fonts.googleapis.com/css2?family=Inter&display=swap">
+  <link rel="stylesheet" href="style.css">
+</head>
+<body>
+  <header><nav>{chrome}</nav></header>
+  <main>{content}</main>
+  <script type="module" src="js/app.js"></script>
+</body>
+</html>
+"""
+
+
+class PrefetchHintsTest(unittest.TestCase):
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self._tmp.name).resolve()
+        patcher = mock.patch.object(prefetch_hints, "SITE_ROOT", self.root)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        (self.root / "js").mkdir()
+        (self.root / "js" / "app.js").write_text("import data from './data.js';\n")
+        (self.root / "js" / "data.js").write_text("export default [];\n")
+        (self.root / "style.css").write_text("body {}\n")
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def page(self, name, chrome=(), content=(), size=None):
+        """Write a page linking to `chrome` and `content`, padded to `size` bytes"""
+        text = PAGE.format(
+            chrome="".join(f'<a href="{href}">nav</a>' for href in chrome),
+            content="".join(f'<a href="{href}">read</a>' for href in content),
+        )
+        if size:
+            text += " " * (size - len(text))
+        path = self.root / name
+        path.write_text(text)
+        return path
+
+    def parse(self, path):
+        parser = _PageParser()
+        parser.feed(path.read_text())
+        return parser
+
+    def test_content_links_rank_above_chrome(self):
+        for name in ("a.html", "b.html", "about.html", "contact.html"):
+            self.page(name)
+        index = self.page("index.html", chrome=["about.html", "contact.html"], content=["a.html", "b.html"])
+
+        ranked = rank_next_pages(index, self.parse(index), {}, {})
+        self.assertEqual([p.name for p in ranked], ["a.html", "b.html", "about.html", "contact.html"])
+
+    def test_recency_breaks_ties(self):
+        for name in ("a.html", "b.html", "c.html", "x.html"):
+            self.page(name)
+        # b scores 1/2 from its content position; c scores 1/4 + 1/4 from its
+        # content and chrome positions, so only recency separates them.
+        index = self.page("index.html", chrome=["c.html"], content=["a.html", "b.html", "x.html", "c.html"])
+        parser = self.parse(index)
+
+        ranked = rank_next_pages(index, parser, {}, {})
+        self.assertEqual([p.name for p in ranked][1:3], ["b.html", "c.html"])
+
+        recency = {self.root / "c.html": 0, self.root / "b.html": 1}
+        ranked = rank_next_pages(index, parser, {}, recency)
+        self.assertEqual([p.name for p in ranked][1:3], ["c.html", "b.html"])
+
+    def test_budget_skips_oversized_candidates(self):
+        self.page("big.html", size=4000)
+        self.page("small.html", size=1000)
+        self.page("tiny.html", size=1000)
+        index = self.page("index.html", content=["big.html", "small.html", "tiny.html"])
+
+        hints = page_hints(index, index.read_text(), {}, {}, budget=2500)
+        prefetched = [h for h in hints if 'rel="prefetch"' in h]
+        self.assertEqual(prefetched, ['<link rel="prefetch" href="small.html">', '<link rel="prefetch" href="tiny.html">'])
+
+        hints = page_hints(index, index.read_text(), {}, {}, budget=2500, max_prefetch=1)
+        self.assertEqual([h for h in hints if 'rel="prefetch"' in h], ['<link rel="prefetch" href="small.html">'])
+
+    def test_preloads_fonts_and_module_imports(self):
+        index = self.page("index.html")
+        hints = page_hints(index, index.read_text(), {}, {}, budget=0)
+        self.assertEqual(hints, [
+            '<link rel="preload" href="https://fonts.googleapis.com/css2?family=Inter&amp;display=swap" as="style">',
+            '<link rel="modulepreload" href="js/app.js">',
+            '<link rel="modulepreload" href="js/data.js">',
+        ])
+
+    def test_apply_is_idempotent(self):
+        (self.root / "posts").mkdir()
+        posts = [self.page(f"posts/{name}.html", chrome=["../index.html"]) for name in ("old", "new")]
+        blog = self.page("blog.html", chrome=["index.html"])
+        index = self.page("index.html", chrome=["blog.html"], content=["posts/old.html"])
+        pages = [index, blog, *posts]
+        listings = {blog: [(posts[1], "2025-02-01"), (posts[0], "2025-01-01")]}
+
+        apply_prefetch_hints(pages, listings)
+        first = {page: page.read_bytes() for page in pages}
+        apply_prefetch_hints(pages, listings)
+        self.assertEqual({page: page.read_bytes() for page in pages}, first)
+
+        for page in pages:
+            text = page.read_text()
+            self.assertEqual(text.count(HINTS_START), 1)
+            self.assertLess(text.index(HINTS_START), text.index("<link"))
+            self.assertLess(text.index(HINTS_END), text.index('<link rel="stylesheet"'))
+        self.assertIn('<link rel="prefetch" href="posts/new.html">', blog.read_text())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,95 @@
+"""Tests for the service worker generator in tools/service_worker.py"""
+
+import json
+import re
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "tools"))
+
+import service_worker  # noqa: E402
+from service_worker import generate_service_worker, precache_manifest, shell_assets  # noqa: E402
+
+TEMPLATE = """<!DOCTYPE html>
+<html>
+<head>
+  <link rel="stylesheet" href="../assets/css/styles.css">
+  <link rel="stylesheet" href="../assets/css/article.css">
+  <link rel="stylesheet" href="https://fonts.googleapis.com/css2?family=Inter">
+</head>
+<body>
+  <script src="../assets/js/article.js"></script>
+  <script src="../assets/js/missing.js"></script>
+</body>
+</html>
+"""
+
+
+class ServiceWorkerTest(unittest.TestCase):
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self._tmp.name).resolve()
+        for module, name, value in (
+            (service_worker, "SITE_ROOT", self.root),
+            (service_worker, "SERVICE_WORKER_PATH", self.root / "sw.js"),
+            (service_worker, "SHELL_ASSETS", ["assets/css/styles.css", "assets/js/main.js"]),
+        ):
+            patcher = mock.patch.object(module, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+        for asset, content in (
+            ("assets/css/styles.css", "body {}"),
+            ("assets/css/article.css", "article {}"),
+            ("assets/js/main.js", "console.log('main');"),
+            ("assets/js/article.js", "console.log('article');"),
+        ):
+            path = self.root / asset
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(content)
+
+        self.template = self.root / "articles" / "article-template.html"
+        self.template.parent.mkdir()
+        self.template.write_text(TEMPLATE)
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def manifest_in_sw(self):
+        text = (self.root / "sw.js").read_text()
+        return json.loads(re.search(r"const PRECACHE_MANIFEST = (\[.*?\]);", text, re.DOTALL).group(1))
+
+    def test_template_assets_join_the_shell(self):
+        self.assertEqual(shell_assets([self.template]), [
+            "assets/css/styles.css",
+            "assets/js/main.js",
+            "assets/css/article.css",
+            "assets/js/article.js",
+        ])
+
+    def test_revision_changes_only_for_the_edited_asset(self):
+        assets = shell_assets([self.template])
+        before = {entry["url"]: entry["revision"] for entry in precache_manifest(assets)}
+        (self.root / "assets" / "js" / "main.js").write_text("console.log('main v2');")
+        after = {entry["url"]: entry["revision"] for entry in precache_manifest(assets)}
+
+        changed = [url for url in assets if before[url] != after[url]]
+        self.assertEqual(changed, ["assets/js/main.js"])
+
+    def test_unchanged_inputs_leave_sw_js_untouched(self):
+        self.assertTrue(generate_service_worker([self.template]))
+        mtime = (self.root / "sw.js").stat().st_mtime_ns
+        self.assertFalse(generate_service_worker([self.template]))
+        self.assertEqual((self.root / "sw.js").stat().st_mtime_ns, mtime)
+
+        (self.root / "assets" / "css" / "article.css").write_text("article { margin: 0 }")
+        self.assertTrue(generate_service_worker([self.template]))
+        self.assertEqual([entry["url"] for entry in self.manifest_in_sw()], shell_assets([self.template]))
+
+
+if __name__ == "__main__":
+    unittest.main()
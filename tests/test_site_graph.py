@@ -0,0 +1,25 @@
+"""Tests for how the site's build steps are wired in tools/site_graph.py"""
+
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "tools"))
+
+from site_graph import COLLECTIONS, site_graph  # noqa: E402
+
+
+class SiteGraphTest(unittest.TestCase):
+
+    def test_sync_refreshes_everything_generated_from_the_data(self):
+        graph = site_graph()
+        for name in COLLECTIONS:
+            with self.subTest(collection=name):
+                self.assertEqual(
+                    set(graph.dependents([f"sync:{name}"])),
+                    {f"sync:{name}", "service-worker", "prefetch-hints"},
+                )
+
+
+if __name__ == "__main__":
+    unittest.main()
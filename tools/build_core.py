@@ -0,0 +1,341 @@
+#!/usr/bin/env python3
+"""
+Shared Build Core for Mehdi Ben Hamida's Website
+
+This module holds the pieces the articles and portfolio tooling have in common:
+1. Slug, JSON and template helpers used by both management scripts
+2. A dependency graph of build nodes (inputs -> action -> outputs)
+3. A content-addressed on-disk cache so only stale nodes are recomputed
+4. A scheduler that runs independent nodes concurrently
+
+A node is fresh when the digests of its inputs, its dependencies' outputs and
+its params hash to the key recorded on the previous run, and its outputs still
+have the recorded digests. Outputs are stored by digest under
+`.build-cache/objects`, so a node whose inputs return to a previously built
+state is restored from the cache instead of being rebuilt.
+"""
+
+import hashlib
+import json
+import os
+import re
+import threading
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from pathlib import Path
+
+SITE_ROOT = Path(__file__).resolve().parent.parent
+CACHE_DIR = SITE_ROOT / ".build-cache"
+STATE_VERSION = 1
+
+
+class BuildError(Exception):
+    """Raised when the build graph itself is invalid (unknown node, cycle)"""
+
+
+def slugify(text):
+    """Convert title to URL-friendly slug"""
+    text = re.sub(r'[^\w\s-]', '', text.lower())
+    return re.sub(r'[-\s]+', '-', text)
+
+
+def load_json(path, default=None):
+    """Load JSON from a file, returning `default` when it does not exist"""
+    path = Path(path)
+    if not path.exists():
+        return [] if default is None else default
+
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def save_json(path, data):
+    """Save JSON to a file using the repository's two-space layout"""
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=2)
+
+
+def write_if_changed(path, content):
+    """Write text only when it differs, so unchanged files keep their mtime"""
+    path = Path(path)
+    if path.exists() and path.read_text(encoding='utf-8') == content:
+        return False
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f".{path.name}.tmp")
+    tmp_path.write_text(content, encoding='utf-8')
+    os.replace(tmp_path, path)
+    return True
+
+
+def render_template(template, values):
+    """Replace every `{{KEY}}` placeholder in a template with its value"""
+    for key, value in values.items():
+        template = template.replace(f"{{{{{key}}}}}", value)
+    return template
+
+
+def file_digest(path):
+    """Return the SHA-256 hex digest of a file's content"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 16), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class Node:
+    """A single build step: reads `inputs`, runs `action`, writes `outputs`"""
+
+    def __init__(self, name, action, inputs=(), outputs=(), deps=(), params=None):
+        self.name = name
+        self.action = action
+        self.inputs = [Path(p) for p in inputs]
+        self.outputs = [Path(p) for p in outputs]
+        self.deps = list(deps)
+        self.params = params
+
+    @property
+    def rewrites_inputs(self):
+        """True for nodes that update one of their own inputs in place"""
+        return bool(set(self.inputs) & set(self.outputs))
+
+
+class BuildGraph:
+    """A DAG of build nodes backed by a content-addressed cache"""
+
+    def __init__(self, root=SITE_ROOT, cache_dir=None):
+        self.root = Path(root)
+        self.cache_dir = Path(cache_dir) if cache_dir else self.root / ".build-cache"
+        self.nodes = {}
+        self._lock = threading.Lock()
+        self._state = None
+
+    def add(self, name, action, inputs=(), outputs=(), deps=(), params=None):
+        """Register a node; returns it so callers can reference it as a dep"""
+        if name in self.nodes:
+            raise BuildError(f"Duplicate build node '{name}'")
+
+        node = Node(name, action, inputs, outputs, deps, params)
+        self.nodes[name] = node
+        return node
+
+    def run(self, targets=None, jobs=None, force=False, downstream=False):
+        """Bring `targets` (default: every node) up to date.
+
+        With `downstream`, every node that depends on a target is brought up
+        to date as well, so no generated file is left describing stale inputs.
+        Returns a dict mapping node name to one of `fresh`, `restored`,
+        `built`, `failed` or `skipped` (a dependency failed).
+        """
+        if downstream and targets is not None:
+            targets = self.dependents(targets)
+        selected = self._closure(targets)
+        self._load_state()
+
+        pending = {name: {d for d in self.nodes[name].deps if d in selected} for name in selected}
+        dependents = {name: [] for name in selected}
+        for name, deps in pending.items():
+            for dep in deps:
+                dependents[dep].append(name)
+
+        results = {}
+        with ThreadPoolExecutor(max_workers=jobs or min(8, (os.cpu_count() or 1) + 2)) as executor:
+            futures = {}
+            scheduled = set()
+
+            def submit_ready():
+                progressed = True
+                while progressed:
+                    progressed = False
+                    for name in sorted(pending):
+                        if pending[name] or name in scheduled:
+                            continue
+                        scheduled.add(name)
+                        progressed = True
+                        if any(results.get(d) in ('failed', 'skipped') for d in self.nodes[name].deps):
+                            results[name] = 'skipped'
+                            release(name)
+                        else:
+                            futures[executor.submit(self._build, self.nodes[name], force)] = name
+
+            def release(name):
+                for child in dependents[name]:
+                    pending[child].discard(name)
+
+            submit_ready()
+            while futures:
+                done, _ = wait(futures, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name = futures.pop(future)
+                    try:
+                        results[name] = future.result()
+                    except Exception as e:
+                        print(f"❌ Build step '{name}' failed: {e}")
+                        results[name] = 'failed'
+                    release(name)
+                submit_ready()
+
+        self._save_state()
+        return results
+
+    def dependents(self, targets):
+        """Return the targets plus every node that transitively depends on them"""
+        selected = []
+        queue = list(targets)
+        while queue:
+            name = queue.pop(0)
+            if name not in self.nodes:
+                raise BuildError(f"Unknown build node '{name}'")
+            if name in selected:
+                continue
+            selected.append(name)
+            queue.extend(n for n, node in self.nodes.items() if name in node.deps)
+        return selected
+
+    def _closure(self, targets):
+        """Return the selected targets plus everything they depend on"""
+        if targets is None:
+            targets = list(self.nodes)
+
+        selected = set()
+        visiting = set()
+
+        def visit(name):
+            if name not in self.nodes:
+                raise BuildError(f"Unknown build node '{name}'")
+            if name in selected:
+                return
+            if name in visiting:
+                raise BuildError(f"Dependency cycle through '{name}'")
+            visiting.add(name)
+            for dep in self.nodes[name].deps:
+                visit(dep)
+            visiting.discard(name)
+            selected.add(name)
+
+        for target in targets:
+            visit(target)
+        return selected
+
+    def _build(self, node, force):
+        """Run one node unless its cached state is still valid"""
+        key = self._node_key(node)
+        with self._lock:
+            record = self._state['nodes'].get(node.name)
+            artifact = self._state['artifacts'].get(key)
+
+        if not force and record and record['key'] == key and self._outputs_match(record['outputs']):
+            return 'fresh'
+
+        if not force and artifact and not node.rewrites_inputs and self._restore(artifact):
+            self._record(node, key, artifact)
+            return 'restored'
+
+        node.action()
+
+        outputs = {}
+        for path in node.outputs:
+            if path.exists():
+                outputs[self._rel(path)] = self._store(path)
+
+        # Nodes that rewrite their own inputs are keyed on the post-build state,
+        # otherwise they would look stale again on the very next run.
+        if node.rewrites_inputs:
+            key = self._node_key(node)
+        self._record(node, key, outputs)
+        return 'built'
+
+    def _node_key(self, node):
+        """Hash params, input digests and dependency output digests"""
+        digest = hashlib.sha256()
+        digest.update(node.name.encode('utf-8'))
+        digest.update(json.dumps(node.params, sort_keys=True, default=str).encode('utf-8'))
+
+        # Inputs are always hashed: an edit that keeps a file's size within one
+        # timestamp tick would otherwise go unnoticed ("racily clean" files).
+        # The stat cache only serves outputs, which the graph writes itself.
+        paths = {path: False for path in node.inputs}
+        for dep in node.deps:
+            for path in self.nodes[dep].outputs:
+                paths.setdefault(path, True)
+
+        for path in sorted(paths):
+            digest.update(self._rel(path).encode('utf-8'))
+            digest.update((self._digest(path, trust_stat=paths[path]) or 'missing').encode('utf-8'))
+        return digest.hexdigest()
+
+    def _digest(self, path, trust_stat=True):
+        """Digest a file, reusing the cached value while size and mtime match"""
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            return None
+
+        rel = self._rel(path)
+        signature = [stat.st_size, stat.st_mtime_ns]
+        with self._lock:
+            cached = self._state['files'].get(rel)
+        if trust_stat and cached and cached[:2] == signature:
+            return cached[2]
+
+        value = file_digest(path)
+        with self._lock:
+            self._state['files'][rel] = signature + [value]
+        return value
+
+    def _outputs_match(self, outputs):
+        return all(self._digest(self.root / rel) == digest for rel, digest in outputs.items())
+
+    def _object_path(self, digest):
+        return self.cache_dir / 'objects' / digest[:2] / digest[2:]
+
+    def _store(self, path):
+        """Copy an output into the object store and return its digest"""
+        digest = self._digest(path)
+        target = self._object_path(digest)
+        if not target.exists():
+            target.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = target.with_name(f"{target.name}.{threading.get_ident()}.tmp")
+            tmp_path.write_bytes(path.read_bytes())
+            os.replace(tmp_path, target)
+        return digest
+
+    def _restore(self, outputs):
+        """Materialise cached outputs; False if any object went missing"""
+        if not all(self._object_path(d).exists() for d in outputs.values()):
+            return False
+
+        for rel, digest in outputs.items():
+            path = self.root / rel
+            if self._digest(path) != digest:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                path.write_bytes(self._object_path(digest).read_bytes())
+        return True
+
+    def _record(self, node, key, outputs):
+        with self._lock:
+            self._state['nodes'][node.name] = {'key': key, 'outputs': outputs}
+            self._state['artifacts'][key] = outputs
+
+    def _rel(self, path):
+        path = Path(path)
+        try:
+            return path.resolve().relative_to(self.root.resolve()).as_posix()
+        except ValueError:
+            return path.resolve().as_posix()
+
+    def _state_path(self):
+        return self.cache_dir / 'state.json'
+
+    def _load_state(self):
+        state = load_json(self._state_path(), default={})
+        if state.get('version') != STATE_VERSION:
+            state = {'version': STATE_VERSION, 'nodes': {}, 'artifacts': {}, 'files': {}}
+        self._state = state
+
+    def _save_state(self):
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp_path = self._state_path().with_suffix('.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self._state, f, sort_keys=True)
+        os.replace(tmp_path, self._state_path())
@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+"""
+Data Module Emitter for Mehdi Ben Hamida's Website
+
+Turns a collection's JSON metadata into an ES module the loaders import:
+
+    const articles = [
+      {"cover": "...", "id": "docker-best-practices", ...},
+      ...
+    ];
+
+    export default articles;
+
+The output is canonical: entries are sorted by `id`, keys are sorted within
+each entry and every entry sits on its own line. Editing one entry therefore
+changes exactly one line of the module, and regenerating unchanged data
+produces byte-identical output. Each entry is serialised independently and
+the lines are joined once, so emission stays linear in the number of entries.
+"""
+
+import json
+
+from build_core import write_if_changed
+
+MODULE_TEMPLATE = """// Generated from {source} by tools/data_modules.py — do not edit by hand.
+// One entry per line, sorted by id, so diffs only touch entries that changed.
+const {export} = [
+{entries}];
+
+export default {export};
+"""
+
+
+def emit_data_module(entries, export, source):
+    """Return the canonical ES module source for a list of entries"""
+    ordered = sorted(entries, key=lambda entry: str(entry.get("id", "")))
+    lines = [
+        f"  {json.dumps(entry, ensure_ascii=False, sort_keys=True, separators=(', ', ': '))},\n"
+        for entry in ordered
+    ]
+    return MODULE_TEMPLATE.format(source=source, export=export, entries="".join(lines))
+
+
+def write_data_module(path, entries, export, source):
+    """Write a data module, leaving the file untouched when nothing changed"""
+    return write_if_changed(path, emit_data_module(entries, export, source))
@@ -0,0 +1,274 @@
+#!/usr/bin/env python3
+"""
+External Link Checker for Mehdi Ben Hamida's Website
+
+Checks that every outbound link on the site (the `github`/`demo` style URL
+fields of each collection and external anchors in every page) still resolves:
+1. URLs are checked concurrently with asyncio
+2. Connections are pooled and kept alive per host
+3. Each host gets its own concurrency limit and minimum request interval
+4. A cheap HEAD request is tried first, falling back to GET when it fails
+5. Verified URLs are cached with a TTL so recent checks are skipped
+
+Only the standard library is used, so the checker runs anywhere the
+management scripts do. Plain `http://` URLs are supported as well, which
+makes it easy to point at a local stub server.
+"""
+
+import asyncio
+import json
+import ssl
+import time
+from collections import defaultdict
+from html.parser import HTMLParser
+from urllib.parse import urljoin, urlsplit
+
+from build_core import CACHE_DIR, SITE_ROOT, load_json, write_if_changed
+from site_graph import COLLECTIONS, site_pages
+
+CACHE_PATH = CACHE_DIR / "external-links.json"
+USER_AGENT = "mbh-link-checker/1.0 (+https://mehdibenhamida.github.io)"
+MAX_REDIRECTS = 5
+
+
+class _AnchorParser(HTMLParser):
+    """Collect absolute http(s) URLs from `<a href>` attributes"""
+
+    def __init__(self):
+        super().__init__()
+        self.urls = []
+
+    def handle_starttag(self, tag, attrs):
+        if tag != 'a':
+            return
+        href = dict(attrs).get('href') or ''
+        if urlsplit(href).scheme in ('http', 'https'):
+            self.urls.append(href)
+
+
+def extract_external_urls():
+    """Map each external URL on the site to the places it appears"""
+    sources = defaultdict(list)
+
+    for collection in COLLECTIONS.values():
+        for entry in load_json(collection["json"]):
+            for field in collection["url_fields"]:
+                url = entry.get(field)
+                if url and urlsplit(url).scheme in ('http', 'https'):
+                    sources[url].append(f"{collection['json'].name}:{entry['id']}.{field}")
+
+    for page in site_pages():
+        parser = _AnchorParser()
+        parser.feed(page.read_text(encoding='utf-8'))
+        location = page.relative_to(SITE_ROOT).as_posix()
+        for url in parser.urls:
+            if location not in sources[url]:
+                sources[url].append(location)
+
+    return dict(sources)
+
+
+class LinkChecker:
+    """Asynchronous URL checker with per-host pooling and rate limiting"""
+
+    def __init__(self, concurrency=20, per_host=4, interval=0.25, timeout=10.0, ssl_context=None):
+        self.timeout = timeout
+        self.interval = interval
+        self.per_host = per_host
+        self.ssl_context = ssl_context or ssl.create_default_context()
+        self._global = asyncio.Semaphore(concurrency)
+        self._host_slots = defaultdict(lambda: asyncio.Semaphore(self.per_host))
+        self._host_locks = defaultdict(asyncio.Lock)
+        self._host_last = defaultdict(float)
+        self._idle = defaultdict(list)
+
+    async def check(self, url):
+        """Check one URL, returning a result dict"""
+        async with self._global:
+            result = await self._follow(url, 'HEAD')
+            if not result['ok']:
+                # Plenty of servers reject or mishandle HEAD; GET is authoritative.
+                result = await self._follow(url, 'GET')
+        result['url'] = url
+        result['checked'] = time.time()
+        return result
+
+    async def close(self):
+        """Close every idle pooled connection"""
+        for connections in self._idle.values():
+            for _, writer in connections:
+                writer.close()
+        self._idle.clear()
+
+    async def _follow(self, url, method):
+        """Issue `method` against `url`, following redirects"""
+        current = url
+        for _ in range(MAX_REDIRECTS + 1):
+            try:
+                status, headers = await self._request(current, method)
+            except (OSError, asyncio.TimeoutError, asyncio.IncompleteReadError,
+                    asyncio.LimitOverrunError, ValueError) as e:
+                return {'ok': False, 'status': None, 'error': str(e) or type(e).__name__, 'final_url': current}
+
+            location = headers.get('location')
+            if 300 <= status < 400 and location:
+                current = urljoin(current, location)
+                continue
+            return {'ok': status < 400, 'status': status, 'error': None, 'final_url': current}
+
+        return {'ok': False, 'status': None, 'error': 'Too many redirects', 'final_url': current}
+
+    async def _request(self, url, method):
+        """Send a single request on a pooled connection and read the head"""
+        parts = urlsplit(url)
+        if parts.scheme not in ('http', 'https') or not parts.hostname:
+            raise ValueError(f"Unsupported URL '{url}'")
+
+        port = parts.port or (443 if parts.scheme == 'https' else 80)
+        host_key = (parts.scheme, parts.hostname, port)
+        path = parts.path or '/'
+        if parts.query:
+            path = f"{path}?{parts.query}"
+
+        host_header = parts.hostname if parts.port is None else f"{parts.hostname}:{parts.port}"
+        # GET bodies are never read, so those connections are not reused.
+        keep_alive = method == 'HEAD'
+        request = (
+            f"{method} {path} HTTP/1.1\r\n"
+            f"Host: {host_header}\r\n"
+            f"User-Agent: {USER_AGENT}\r\n"
+            "Accept: */*\r\n"
+            f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n"
+        ).encode('latin-1')
+
+        async with self._host_slots[host_key]:
+            await self._throttle(host_key)
+            # Only the network round trip is timed, not the wait for a slot.
+            reader, writer, status, headers = await asyncio.wait_for(
+                self._transact(host_key, request), self.timeout)
+
+            if keep_alive and headers.get('connection', '').lower() != 'close':
+                self._idle[host_key].append((reader, writer))
+            else:
+                writer.close()
+
+        return status, headers
+
+    async def _transact(self, host_key, request):
+        """Send a request on a pooled connection, retrying once on a stale one"""
+        reader, writer, reused = await self._acquire(host_key)
+        try:
+            status, headers = await self._exchange(reader, writer, request)
+        except (OSError, asyncio.IncompleteReadError):
+            if not reused:
+                raise
+            # The server dropped an idle keep-alive connection; retry fresh.
+            reader, writer, _ = await self._acquire(host_key, fresh=True)
+            status, headers = await self._exchange(reader, writer, request)
+        return reader, writer, status, headers
+
+    async def _throttle(self, host_key):
+        """Enforce the minimum interval between requests to one host"""
+        async with self._host_locks[host_key]:
+            wait = self._host_last[host_key] + self.interval - time.monotonic()
+            if wait > 0:
+                await asyncio.sleep(wait)
+            self._host_last[host_key] = time.monotonic()
+
+    async def _acquire(self, host_key, fresh=False):
+        """Reuse an idle connection to the host or open a new one"""
+        idle = self._idle[host_key]
+        while idle and not fresh:
+            reader, writer = idle.pop()
+            if not writer.is_closing() and not reader.at_eof():
+                return reader, writer, True
+            writer.close()
+
+        scheme, host, port = host_key
+        reader, writer = await asyncio.open_connection(
+            host, port,
+            ssl=self.ssl_context if scheme == 'https' else None,
+            server_hostname=host if scheme == 'https' else None,
+        )
+        return reader, writer, False
+
+    async def _exchange(self, reader, writer, request):
+        """Write a request and read the response head, closing on failure"""
+        try:
+            writer.write(request)
+            await writer.drain()
+            return await self._read_head(reader)
+        except BaseException:
+            writer.close()
+            raise
+
+    async def _read_head(self, reader):
+        """Read the status line and headers of a response"""
+        while True:
+            line = await reader.readuntil(b'\r\n')
+            parts = line.decode('latin-1').split(None, 2)
+            if len(parts) < 2 or not parts[0].startswith('HTTP/'):
+                raise ValueError(f"Malformed status line {line!r}")
+            status = int(parts[1])
+
+            headers = {}
+            while True:
+                line = await reader.readuntil(b'\r\n')
+                if line == b'\r\n':
+                    break
+                key, _, value = line.decode('latin-1').partition(':')
+                headers[key.strip().lower()] = value.strip()
+
+            # Skip interim 1xx responses such as 100 Continue.
+            if status >= 200:
+                return status, headers
+
+
+async def check_urls(urls, cache=None, ttl=86400, **options):
+    """Check `urls` concurrently, skipping entries verified within `ttl` seconds.
+
+    `cache` is a dict of previous results keyed by URL; it is updated in place
+    and the results for `urls` are returned.
+    """
+    cache = {} if cache is None else cache
+    now = time.time()
+    stale = [url for url in urls
+             if not (url in cache and cache[url]['ok'] and now - cache[url]['checked'] < ttl)]
+
+    checker = LinkChecker(**options)
+    try:
+        for result in await asyncio.gather(*(checker.check(url) for url in stale)):
+            cache[result['url']] = result
+    finally:
+        await checker.close()
+
+    return {url: cache[url] for url in urls}
+
+
+def check_external_links(ttl_hours=24, use_cache=True, **options):
+    """Check every external link on the site and print any that are broken"""
+    sources = extract_external_urls()
+    if not sources:
+        print("No external links found.")
+        return True
+
+    cache = load_json(CACHE_PATH, default={})
+    before = {url: cache[url]['checked'] for url in sources if url in cache}
+    ttl = ttl_hours * 3600 if use_cache else 0
+    results = asyncio.run(check_urls(sorted(sources), cache, ttl, **options))
+    write_if_changed(CACHE_PATH, json.dumps(cache, indent=2, sort_keys=True))
+
+    skipped = sum(1 for url, result in results.items() if before.get(url) == result['checked'])
+    broken = {url: result for url, result in results.items() if not result['ok']}
+
+    print(f"Checked {len(results) - skipped} external links ({skipped} cached)")
+    if broken:
+        print("Broken external links found:")
+        for url, result in broken.items():
+            reason = f"HTTP {result['status']}" if result['status'] else result['error']
+            print(f"❌ {url} ({reason})")
+            print(f"   Found in: {', '.join(sources[url])}")
+        return False
+
+    print("✅ All external links resolved successfully!")
+    return True
@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""
+Resource Hint Injection for Mehdi Ben Hamida's Website
+
+Builds the site's internal link graph and writes resource hints into the
+`<head>` of every page:
+1. `preload` for the Google Fonts stylesheet, so it is discovered early
+2. `modulepreload` for the page's ES modules and their static imports
+3. `prefetch` for the pages a visitor is most likely to open next
+
+Prefetch candidates come from the page's own anchors plus the collection
+entries its loader renders (articles on `articles.html`, projects on
+`portfolio.html`). They are ranked by position on the page, with navigation
+chrome weighted down, and by recency of the entry's `published`/`created`
+date. Candidates are added in rank order until the byte budget is spent or
+the page has `max_prefetch` prefetch hints.
+
+Hints live between `<!-- build:hints -->` markers and are replaced on every
+run, so the pass is idempotent.
+"""
+
+import html
+import os
+import re
+from collections import defaultdict
+from html.parser import HTMLParser
+from pathlib import Path
+from urllib.parse import urlsplit
+
+from build_core import SITE_ROOT, write_if_changed
+
+DEFAULT_BUDGET = 96 * 1024
+DEFAULT_MAX_PREFETCH = 4
+CHROME_WEIGHT = 0.25
+RECENCY_WEIGHT = 0.5
+
+HINTS_START = "<!-- build:hints (generated by tools/prefetch_hints.py) -->"
+HINTS_END = "<!-- /build:hints -->"
+HINTS_PATTERN = re.compile(r"\n[ \t]*<!-- build:hints\b.*?<!-- /build:hints -->", re.DOTALL)
+FIRST_LINK_PATTERN = re.compile(r"^([ \t]*)<link\b", re.MULTILINE)
+IMPORT_PATTERN = re.compile(r"""^\s*(?:import|export)\b[^'"]*?\bfrom\s*['"]([^'"]+)['"]|^\s*import\s*['"]([^'"]+)['"]""", re.MULTILINE)
+
+
+class _PageParser(HTMLParser):
+    """Collect anchors, module scripts and font stylesheets from a page"""
+
+    CHROME_TAGS = ('header', 'nav', 'footer')
+
+    def __init__(self):
+        super().__init__()
+        self.anchors = []
+        self.modules = []
+        self.font_stylesheets = []
+        self._chrome_depth = 0
+
+    def handle_starttag(self, tag, attrs):
+        attrs = dict(attrs)
+        if tag in self.CHROME_TAGS:
+            self._chrome_depth += 1
+        elif tag == 'a' and attrs.get('href'):
+            self.anchors.append((attrs['href'], self._chrome_depth > 0))
+        elif tag == 'script' and attrs.get('type') == 'module' and attrs.get('src'):
+            self.modules.append(attrs['src'])
+        elif tag == 'link' and attrs.get('rel') == 'stylesheet' and 'fonts.googleapis.com' in (attrs.get('href') or ''):
+            self.font_stylesheets.append(attrs['href'])
+
+    def handle_endtag(self, tag):
+        if tag in self.CHROME_TAGS and self._chrome_depth:
+            self._chrome_depth -= 1
+
+
+def _resolve(page, href):
+    """Resolve an href on `page` to a site file, or None if it is external"""
+    parts = urlsplit(href)
+    if parts.scheme or parts.netloc or not parts.path:
+        return None
+
+    if parts.path.startswith('/'):
+        target = SITE_ROOT / parts.path.lstrip('/')
+    else:
+        target = page.parent / parts.path
+    if parts.path.endswith('/'):
+        target = target / 'index.html'
+
+    target = Path(os.path.normpath(target))
+    if SITE_ROOT not in target.parents or not target.is_file():
+        return None
+    return target
+
+
+def _href(page, target):
+    """Return a page-relative href for a site file"""
+    return Path(os.path.relpath(target, page.parent)).as_posix()
+
+
+def _module_closure(page, sources):
+    """Return a page's module scripts plus everything they statically import"""
+    seen = []
+    queue = [t for t in (_resolve(page, src) for src in sources) if t]
+    while queue:
+        module = queue.pop(0)
+        if module in seen:
+            continue
+        seen.append(module)
+        for match in IMPORT_PATTERN.finditer(module.read_text(encoding='utf-8')):
+            specifier = match.group(1) or match.group(2)
+            if specifier.startswith(('./', '../', '/')):
+                target = _resolve(module, specifier)
+                if target:
+                    queue.append(target)
+    return seen
+
+
+def rank_next_pages(page, parser, listings, recency):
+    """Score every internal HTML page reachable from `page`"""
+    content = list(listings.get(page, []))
+    chrome = []
+    for href, in_chrome in parser.anchors:
+        target = _resolve(page, href)
+        if target and target.suffix == '.html' and target != page:
+            (chrome if in_chrome else content).append(target)
+
+    scores = defaultdict(float)
+    for position, target in enumerate(content):
+        scores[target] += 1.0 / (1 + position)
+    for position, target in enumerate(chrome):
+        scores[target] += CHROME_WEIGHT / (1 + position)
+    for target in scores:
+        if target in recency:
+            scores[target] += RECENCY_WEIGHT / (1 + recency[target])
+
+    return sorted(scores, key=lambda target: (-scores[target], target.as_posix()))
+
+
+def page_hints(page, text, listings, recency, budget, max_prefetch=DEFAULT_MAX_PREFETCH):
+    """Return the hint `<link>` tags for one page"""
+    parser = _PageParser()
+    parser.feed(text)
+
+    hints = []
+    for href in parser.font_stylesheets:
+        hints.append(f'<link rel="preload" href="{html.escape(href)}" as="style">')
+    for module in _module_closure(page, parser.modules):
+        hints.append(f'<link rel="modulepreload" href="{_href(page, module)}">')
+
+    spent = 0
+    prefetched = 0
+    for target in rank_next_pages(page, parser, listings, recency):
+        size = target.stat().st_size
+        if prefetched == max_prefetch:
+            break
+        if spent + size > budget:
+            continue
+        hints.append(f'<link rel="prefetch" href="{_href(page, target)}">')
+        spent += size
+        prefetched += 1
+
+    return hints
+
+
+def apply_prefetch_hints(pages, listings, budget=DEFAULT_BUDGET, max_prefetch=DEFAULT_MAX_PREFETCH):
+    """Rewrite the hints block of every page.
+
+    `listings` maps a listing page to the entry pages its loader renders,
+    as `(path, date)` pairs in display order.
+    """
+    dated = sorted(
+        {(date, path) for entries in listings.values() for path, date in entries if date},
+        key=lambda item: (item[0], item[1].as_posix()),
+        reverse=True,
+    )
+    recency = {path: rank for rank, (_, path) in enumerate(dated)}
+    listing_pages = {
+        listing: [path for path, _ in entries if path.is_file()]
+        for listing, entries in listings.items()
+    }
+
+    updated = 0
+    for page in pages:
+        original = page.read_text(encoding='utf-8')
+        text = HINTS_PATTERN.sub('', original)
+        hints = page_hints(page, text, listing_pages, recency, budget, max_prefetch)
+
+        match = FIRST_LINK_PATTERN.search(text)
+        if hints and match:
+            indent = match.group(1)
+            block = "\n".join([HINTS_START, *hints, HINTS_END])
+            block = "\n".join(f"{indent}{line}" for line in block.split("\n"))
+            text = text[:match.start()] + block + "\n" + text[match.start():]
+
+        if write_if_changed(page, text):
+            updated += 1
+
+    if updated:
+        print(f"✅ Updated resource hints in {updated} pages")
@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+Service Worker Generator for Mehdi Ben Hamida's Website
+
+Generates `sw.js` at the site root with:
+1. A precache manifest of the shell assets, each tagged with a content hash
+2. Stale-while-revalidate runtime caching for article and project pages
+
+Each precached asset is fetched under a URL that includes its revision, so a
+deploy only re-downloads the assets whose content actually changed. The
+generator runs as a node in the site build graph, downstream of the data
+module sync steps, and is skipped entirely while none of its inputs change.
+"""
+
+import json
+import os
+import re
+from pathlib import Path
+
+from build_core import SITE_ROOT, file_digest, render_template, write_if_changed
+
+SERVICE_WORKER_PATH = SITE_ROOT / "sw.js"
+CACHE_PREFIX = "mbh"
+
+# Assets every page needs; paths are relative to the site root. Local
+# stylesheets and scripts referenced by the page templates are added to these.
+SHELL_ASSETS = [
+    "assets/css/styles.css",
+    "assets/css/prism-theme.css",
+    "assets/js/main.js",
+    "assets/js/articles-loader.js",
+    "assets/js/portfolio-loader.js",
+    "assets/js/data/articles.js",
+    "assets/js/data/projects.js",
+    "assets/js/syntax-highlighter.js",
+    "assets/img/favicon.ico",
+]
+
+LOCAL_ASSET_PATTERN = re.compile(r"""<(?:link|script)\b[^>]*?\b(?:href|src)=["']([^"':#?]+\.(?:css|js|ico))["']""")
+
+# Pages served stale-while-revalidate, as JavaScript regex sources over the
+# scope-relative path (slashes escaped for use in a regex literal).
+RUNTIME_ROUTES = [
+    r"^articles\.html$",
+    r"^articles\/[^\/]+\.html$",
+    r"^portfolio\.html$",
+    r"^portfolio\/[^\/]+\.html$",
+]
+
+SERVICE_WORKER_TEMPLATE = '''// Generated by tools/service_worker.py — do not edit by hand.
+// Run `python3 articles/manage_articles.py build` to regenerate.
+const PRECACHE = '{{PREFIX}}-precache';
+const RUNTIME = '{{PREFIX}}-pages';
+const PRECACHE_MANIFEST = {{MANIFEST}};
+const RUNTIME_ROUTES = [{{ROUTES}}];
+
+const scopeUrl = new URL(self.registration.scope);
+const revisionedUrl = entry => new URL(`${entry.url}?__rev=${entry.revision}`, scopeUrl).href;
+const precacheKeys = new Map(
+  PRECACHE_MANIFEST.map(entry => [new URL(entry.url, scopeUrl).href, revisionedUrl(entry)])
+);
+
+self.addEventListener('install', event => {
+  event.waitUntil((async () => {
+    const cache = await caches.open(PRECACHE);
+    // Only assets whose revision changed since the last deploy are fetched.
+    await Promise.all(PRECACHE_MANIFEST.map(async entry => {
+      const key = revisionedUrl(entry);
+      if (!(await cache.match(key))) {
+        const response = await fetch(key, { cache: 'no-cache' });
+        if (!response.ok) throw new Error(`Precache failed for ${entry.url}: ${response.status}`);
+        await cache.put(key, response);
+      }
+    }));
+    await self.skipWaiting();
+  })());
+});
+
+self.addEventListener('activate', event => {
+  event.waitUntil((async () => {
+    const expected = new Set(precacheKeys.values());
+    const cache = await caches.open(PRECACHE);
+    for (const request of await cache.keys()) {
+      if (!expected.has(request.url)) await cache.delete(request);
+    }
+    for (const name of await caches.keys()) {
+      if (name.startsWith('{{PREFIX}}-') && name !== PRECACHE && name !== RUNTIME) await caches.delete(name);
+    }
+    await self.clients.claim();
+  })());
+});
+
+const staleWhileRevalidate = async (event, request) => {
+  const cache = await caches.open(RUNTIME);
+  const cached = await cache.match(request, { ignoreSearch: true });
+  const network = fetch(request).then(response => {
+    if (response.ok) cache.put(request, response.clone());
+    return response;
+  });
+  if (cached) {
+    event.waitUntil(network.catch(() => undefined));
+    return cached;
+  }
+  return network;
+};
+
+self.addEventListener('fetch', event => {
+  const { request } = event;
+  if (request.method !== 'GET') return;
+
+  const url = new URL(request.url);
+  if (url.origin !== scopeUrl.origin) return;
+
+  const precacheKey = precacheKeys.get(url.origin + url.pathname);
+  if (precacheKey) {
+    event.respondWith(caches.open(PRECACHE)
+      .then(cache => cache.match(precacheKey))
+      .then(cached => cached || fetch(request)));
+    return;
+  }
+
+  const path = url.pathname.slice(scopeUrl.pathname.length);
+  if (RUNTIME_ROUTES.some(route => route.test(path))) {
+    event.respondWith(staleWhileRevalidate(event, request));
+  }
+});
+'''
+
+
+def shell_assets(templates=()):
+    """Return SHELL_ASSETS plus the local assets the templates reference"""
+    assets = list(SHELL_ASSETS)
+    for template in templates:
+        if not template.exists():
+            continue
+        for href in LOCAL_ASSET_PATTERN.findall(template.read_text(encoding='utf-8')):
+            path = Path(os.path.normpath(template.parent / href))
+            if SITE_ROOT in path.parents and path.is_file():
+                asset = path.relative_to(SITE_ROOT).as_posix()
+                if asset not in assets:
+                    assets.append(asset)
+    return assets
+
+
+def precache_manifest(assets=SHELL_ASSETS):
+    """Return the `{url, revision}` entries for every shell asset"""
+    return [
+        {"url": asset, "revision": file_digest(SITE_ROOT / asset)[:16]}
+        for asset in assets
+    ]
+
+
+def generate_service_worker(templates=()):
+    """Write sw.js with the current precache manifest; returns True if it changed"""
+    manifest = precache_manifest(shell_assets(templates))
+    entries = ",\n".join(f"  {json.dumps(entry, sort_keys=True)}" for entry in manifest)
+    content = render_template(SERVICE_WORKER_TEMPLATE, {
+        "PREFIX": CACHE_PREFIX,
+        "MANIFEST": f"[\n{entries}\n]",
+        "ROUTES": ", ".join(f"/{route}/" for route in RUNTIME_ROUTES),
+    })
+
+    if not write_if_changed(SERVICE_WORKER_PATH, content):
+        return False
+
+    print(f"✅ Generated service worker with {len(manifest)} precached assets")
+    return True
@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+Shared Command-Line Front End for Mehdi Ben Hamida's Website
+
+Both management scripts are thin wrappers around `collection_main`, which
+wires up the commands every collection has in common:
+1. list, validate and template, driven by the collection's settings
+2. sync and build, which run the shared site build graph (sync also
+   refreshes every step downstream of the collection's data module)
+3. check-external, which runs the external link checker
+
+Each script only supplies its page template and its `create` command.
+"""
+
+import argparse
+
+from build_core import load_json
+from link_checker import check_external_links
+from prefetch_hints import DEFAULT_BUDGET, DEFAULT_MAX_PREFETCH
+from site_graph import COLLECTIONS, run_build
+
+
+def list_entries(name):
+    """List every entry of a collection"""
+    collection = COLLECTIONS[name]
+    entries = load_json(collection["json"])
+
+    if not entries:
+        print(f"No {collection['label']} found.")
+        return
+
+    print(f"Found {len(entries)} {collection['label']}:")
+    print("=" * 50)
+
+    for entry in entries:
+        status_indicator = "✅" if entry["status"] == "published" else "📝"
+        featured_indicator = "🌟 " if entry.get("featured", False) else ""
+        print(f"{status_indicator} {featured_indicator}{entry['title']}")
+        for label, field in collection["list_fields"]:
+            value = entry.get(field)
+            if value:
+                print(f"   {label}: {', '.join(value) if isinstance(value, list) else value}")
+        print()
+
+
+def validate_entries(name):
+    """Validate a collection's entries; returns True when no issues were found"""
+    collection = COLLECTIONS[name]
+    issues = []
+
+    for entry in load_json(collection["json"]):
+        title = entry.get('title', entry.get('id', '?'))
+
+        # Check if HTML file exists
+        try:
+            page = collection["entry_page"].format(**entry)
+        except KeyError:
+            page = None
+        if page and not (collection["pages"] / page).exists():
+            issues.append(f"Missing file: {page} for {collection['singular']} '{title}'")
+
+        # Check for required fields
+        for field in collection["required_fields"]:
+            if not entry.get(field):
+                issues.append(f"Missing {field} for {collection['singular']} '{title}'")
+
+    if issues:
+        print("Validation issues found:")
+        for issue in issues:
+            print(f"❌ {issue}")
+        return False
+
+    print(f"✅ All {collection['label']} validated successfully!")
+    return True
+
+
+def write_template(name, template):
+    """Write a collection's page template"""
+    path = COLLECTIONS[name]["template"]
+    path.write_text(template)
+    print(f"Created {COLLECTIONS[name]['singular']} template at {path}")
+
+
+def add_build_arguments(parser):
+    """Add the options shared by every command that runs the build graph"""
+    parser.add_argument('--jobs', type=int, default=None, help='Maximum build steps to run concurrently')
+    parser.add_argument('--force', action='store_true', help='Rebuild even if cached outputs are fresh')
+    parser.add_argument('--prefetch-budget', type=int, default=DEFAULT_BUDGET, help='Bytes of pages each page may prefetch')
+    parser.add_argument('--max-prefetch', type=int, default=DEFAULT_MAX_PREFETCH, help='Most pages each page may prefetch')
+
+
+def add_link_check_arguments(parser):
+    """Add the options of the external link checker"""
+    parser.add_argument('--ttl', type=float, default=24, help='Hours a verified link stays cached')
+    parser.add_argument('--no-cache', action='store_true', help='Recheck every link, ignoring cached results')
+    parser.add_argument('--concurrency', type=int, default=20, help='Maximum requests in flight')
+    parser.add_argument('--per-host', type=int, default=4, help='Maximum concurrent requests per host')
+    parser.add_argument('--interval', type=float, default=0.25, help='Minimum seconds between requests to one host')
+    parser.add_argument('--timeout', type=float, default=10.0, help='Per-request timeout in seconds')
+
+
+def collection_main(name, description, template, add_create_arguments, create):
+    """Parse the command line and run a management command for a collection.
+
+    `add_create_arguments(parser)` declares the collection's `create` options
+    and `create(args)` runs it, returning True on success. Returns the process
+    exit status: 0 on success, 1 when the command failed (a build step failed,
+    validation found issues, or external links are broken).
+    """
+    collection = COLLECTIONS[name]
+    parser = argparse.ArgumentParser(description=description)
+    subparsers = parser.add_subparsers(dest='command', help='Available commands')
+
+    # Create command
+    add_create_arguments(subparsers.add_parser('create', help=f"Create a new {collection['singular']}"))
+
+    # List command
+    subparsers.add_parser('list', help=f"List all {collection['label']}")
+
+    # Validate command
+    subparsers.add_parser('validate', help=f"Validate {collection['label']}")
+
+    # Template command
+    subparsers.add_parser('template', help=f"Create {collection['singular']} template")
+
+    # Sync command
+    add_build_arguments(subparsers.add_parser('sync', help=f"Sync {collection['label']} data to JavaScript for GitHub Pages"))
+
+    # Build command
+    add_build_arguments(subparsers.add_parser('build', help='Rebuild every stale generated file on the site'))
+
+    # Check external links command
+    add_link_check_arguments(subparsers.add_parser('check-external', help='Check that external links still resolve'))
+
+    args = parser.parse_args()
+
+    if args.command == 'create':
+        ok = create(args)
+    elif args.command == 'list':
+        list_entries(name)
+        ok = True
+    elif args.command == 'validate':
+        ok = validate_entries(name)
+    elif args.command == 'template':
+        write_template(name, template)
+        ok = True
+    elif args.command == 'sync':
+        # Also refresh everything generated from the data module: sw.js and
+        # the resource hints of every page.
+        ok = run_build([f"sync:{name}"], jobs=args.jobs, force=args.force,
+                       prefetch_budget=args.prefetch_budget, max_prefetch=args.max_prefetch, downstream=True)
+    elif args.command == 'build':
+        ok = run_build(jobs=args.jobs, force=args.force, prefetch_budget=args.prefetch_budget,
+                       max_prefetch=args.max_prefetch)
+    elif args.command == 'check-external':
+        ok = check_external_links(
+            ttl_hours=args.ttl,
+            use_cache=not args.no_cache,
+            concurrency=args.concurrency,
+            per_host=args.per_host,
+            interval=args.interval,
+            timeout=args.timeout
+        )
+    else:
+        parser.print_help()
+        ok = True
+
+    return 0 if ok else 1
@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+Site Build Graph for Mehdi Ben Hamida's Website
+
+Describes the content collections (articles and portfolio projects) and wires
+their build steps into a single `BuildGraph`, so both management scripts share
+one incremental, concurrent build instead of duplicating the sync logic.
+
+Syncing a collection emits its metadata as an ES data module under
+`assets/js/data/`, which the corresponding loader imports.
+"""
+
+from build_core import SITE_ROOT, BuildGraph, load_json
+from data_modules import write_data_module
+from prefetch_hints import DEFAULT_BUDGET, DEFAULT_MAX_PREFETCH, apply_prefetch_hints
+from service_worker import (
+    CACHE_PREFIX,
+    RUNTIME_ROUTES,
+    SERVICE_WORKER_PATH,
+    SERVICE_WORKER_TEMPLATE,
+    generate_service_worker,
+    shell_assets,
+)
+
+COLLECTIONS = {
+    "articles": {
+        "label": "articles",
+        "singular": "article",
+        "json": SITE_ROOT / "articles" / "articles.json",
+        "loader": SITE_ROOT / "assets" / "js" / "articles-loader.js",
+        "module": SITE_ROOT / "assets" / "js" / "data" / "articles.js",
+        "export": "articles",
+        "pages": SITE_ROOT / "articles",
+        "template": SITE_ROOT / "articles" / "article-template.html",
+        "url_fields": [],
+        "listing": SITE_ROOT / "articles.html",
+        "entry_page": "{url}",
+        "date_field": "published",
+        "required_fields": ["id", "title", "subtitle", "description", "published", "status", "url"],
+        "list_fields": [("ID", "id"), ("Subtitle", "subtitle"), ("Status", "status"), ("Published", "published")],
+    },
+    "projects": {
+        "label": "projects",
+        "singular": "project",
+        "json": SITE_ROOT / "portfolio" / "projects.json",
+        "loader": SITE_ROOT / "assets" / "js" / "portfolio-loader.js",
+        "module": SITE_ROOT / "assets" / "js" / "data" / "projects.js",
+        "export": "projects",
+        "pages": SITE_ROOT / "portfolio",
+        "template": SITE_ROOT / "portfolio" / "project-template.html",
+        "url_fields": ["github", "demo"],
+        "listing": SITE_ROOT / "portfolio.html",
+        "entry_page": "{id}.html",
+        "date_field": "created",
+        "required_fields": ["id", "title", "subtitle", "description", "created", "status"],
+        "list_fields": [
+            ("ID", "id"), ("Subtitle", "subtitle"), ("Status", "status"), ("Created", "created"),
+            ("GitHub", "github"), ("Tech", "technologies"),
+        ],
+    },
+}
+
+
+def collection_pages(name):
+    """Return the collection's HTML pages, excluding its template"""
+    collection = COLLECTIONS[name]
+    return sorted(p for p in collection["pages"].glob("*.html") if p != collection["template"])
+
+
+def site_pages():
+    """Return every published HTML page on the site"""
+    pages = sorted(SITE_ROOT.glob("*.html"))
+    for name in COLLECTIONS:
+        pages.extend(collection_pages(name))
+    return pages
+
+
+def collection_listings():
+    """Map each listing page to its published entry pages, in display order"""
+    listings = {}
+    for collection in COLLECTIONS.values():
+        entries = [e for e in load_json(collection["json"]) if e.get("status") == "published"]
+        # Same order as the loaders: newest first, featured entries on top.
+        entries.sort(key=lambda e: e.get(collection["date_field"], ""), reverse=True)
+        entries.sort(key=lambda e: not e.get("featured", False))
+        listings[collection["listing"]] = [
+            (collection["pages"] / collection["entry_page"].format(**e), e.get(collection["date_field"]))
+            for e in entries
+        ]
+    return listings
+
+
+def sync_collection_to_js(name):
+    """Emit a collection's JSON metadata as the data module its loader imports"""
+    collection = COLLECTIONS[name]
+    data = load_json(collection["json"])
+    source = collection["json"].relative_to(SITE_ROOT).as_posix()
+
+    if write_data_module(collection["module"], data, collection["export"], source):
+        print(f"✅ Synced {len(data)} {collection['label']} to {collection['module'].name} data module")
+
+
+def site_graph(prefetch_budget=DEFAULT_BUDGET, max_prefetch=DEFAULT_MAX_PREFETCH):
+    """Build the graph of every generated artefact on the site"""
+    graph = BuildGraph(SITE_ROOT)
+
+    for name, collection in COLLECTIONS.items():
+        graph.add(
+            f"sync:{name}",
+            lambda name=name: sync_collection_to_js(name),
+            inputs=[collection["json"]],
+            outputs=[collection["module"]],
+        )
+
+    # Templates are inputs: the local assets they reference join the precache.
+    # Every other generator input goes into params; the asset list keeps its
+    # order because the manifest is emitted in that order.
+    templates = [c["template"] for c in COLLECTIONS.values()]
+    assets = shell_assets(templates)
+    graph.add(
+        "service-worker",
+        lambda: generate_service_worker(templates),
+        inputs=templates + [SITE_ROOT / asset for asset in assets],
+        outputs=[SERVICE_WORKER_PATH],
+        deps=[f"sync:{name}" for name in COLLECTIONS],
+        params={
+            "template": SERVICE_WORKER_TEMPLATE,
+            "prefix": CACHE_PREFIX,
+            "routes": RUNTIME_ROUTES,
+            "assets": assets,
+        },
+    )
+
+    pages = site_pages()
+    graph.add(
+        "prefetch-hints",
+        lambda: apply_prefetch_hints(pages, collection_listings(), prefetch_budget, max_prefetch),
+        inputs=pages + [path for c in COLLECTIONS.values() for path in (c["json"], c["loader"])],
+        outputs=pages,
+        deps=[f"sync:{name}" for name in COLLECTIONS],
+        params={"budget": prefetch_budget, "max_prefetch": max_prefetch},
+    )
+
+    return graph
+
+
+def run_build(targets=None, jobs=None, force=False, prefetch_budget=DEFAULT_BUDGET,
+              max_prefetch=DEFAULT_MAX_PREFETCH, downstream=False):
+    """Run the site graph and report what happened; returns True on success"""
+    results = site_graph(prefetch_budget, max_prefetch).run(targets, jobs=jobs, force=force, downstream=downstream)
+
+    for name in sorted(results):
+        status = results[name]
+        indicator = {"fresh": "⏭️ ", "restored": "♻️ ", "built": "✅", "failed": "❌", "skipped": "⚠️ "}[status]
+        print(f"{indicator} {name}: {status}")
+
+    return all(status not in ("failed", "skipped") for status in results.values())